@@ -0,0 +1,163 @@
+import AppKit
+
+// MARK: - Status Icon Key
+
+/// Identifies a distinct status item icon. Percentages are whole numbers, so
+/// there are at most a few hundred keys.
+enum StatusIconKey: Hashable {
+    case beforeWorkHours
+    case active(Int)
+    case pausedManual(Int)
+    case afterWorkHours(Int)
+
+    init(trackingState: TrackingState, workPercentage: Double) {
+        let percentage = Int(workPercentage)
+        switch trackingState {
+        case .beforeWorkHours:
+            self = .beforeWorkHours
+        case .active:
+            self = .active(percentage)
+        case .pausedManual:
+            self = .pausedManual(percentage)
+        case .afterWorkHours:
+            self = .afterWorkHours(percentage)
+        }
+    }
+}
+
+// MARK: - Status Icon Renderer
+
+/// Draws the menubar status item icons and keeps every rendered image, along
+/// with the SF Symbols they embed, so repeated states never redraw.
+///
+/// The drawing handlers resolve colors at draw time, so cached images stay
+/// correct across appearance changes.
+final class StatusIconRenderer {
+    private var imageCache: [StatusIconKey: NSImage] = [:]
+    private var symbolCache: [String: NSImage] = [:]
+
+    /// Text attributes shared by every percentage icon. headerTextColor is a
+    /// dynamic color, so it still follows the menubar appearance when drawn.
+    private static let percentageAttributes: [NSAttributedString.Key: Any] = [
+        .font: NSFont.monospacedDigitSystemFont(ofSize: 11, weight: .semibold),
+        .foregroundColor: NSColor.headerTextColor,
+    ]
+
+    private static let symbolConfiguration = NSImage.SymbolConfiguration(pointSize: 10, weight: .medium)
+
+    private static let iconHeight: CGFloat = 16
+
+    func image(for key: StatusIconKey) -> NSImage? {
+        if let cached = imageCache[key] {
+            return cached
+        }
+        let image = render(key)
+        imageCache[key] = image
+        return image
+    }
+
+    private func render(_ key: StatusIconKey) -> NSImage? {
+        switch key {
+        case .beforeWorkHours:
+            return NSImage(
+                systemSymbolName: "sun.max.fill",
+                accessibilityDescription: "Zeit - Before Work Hours"
+            )
+        case .active(let percentage):
+            return renderPercentageWithDot(percentage: percentage, dotColor: .systemGreen)
+        case .pausedManual(let percentage):
+            return renderPercentageWithDot(percentage: percentage, dotColor: .systemOrange)
+        case .afterWorkHours(let percentage):
+            return renderPercentageWithSymbol(
+                percentage: percentage,
+                symbolName: "moon.fill"
+            )
+        }
+    }
+
+    private func symbol(named name: String) -> NSImage? {
+        if let cached = symbolCache[name] {
+            return cached
+        }
+        let symbol = NSImage(systemSymbolName: name, accessibilityDescription: nil)?
+            .withSymbolConfiguration(Self.symbolConfiguration)
+        symbolCache[name] = symbol
+        return symbol
+    }
+
+    /// Renders a percentage text with a small colored dot indicator.
+    private func renderPercentageWithDot(percentage: Int, dotColor: NSColor) -> NSImage {
+        let text = "\(percentage)%"
+        let attributes = Self.percentageAttributes
+        let textSize = (text as NSString).size(withAttributes: attributes)
+        let dotDiameter: CGFloat = 5
+        let dotSpacing: CGFloat = 3
+        // Size to the measured text, rounded up to whole points so the
+        // backing store isn't padded or resampled at a fractional width
+        let width = ceil(textSize.width + dotSpacing + dotDiameter + 2)
+
+        let image = NSImage(size: NSSize(width: width, height: Self.iconHeight), flipped: false) { rect in
+            // Draw percentage text
+            let textRect = NSRect(
+                x: 0,
+                y: (rect.height - textSize.height) / 2,
+                width: textSize.width,
+                height: textSize.height
+            )
+            (text as NSString).draw(in: textRect, withAttributes: attributes)
+
+            // Draw colored dot
+            let dotRect = NSRect(
+                x: textSize.width + dotSpacing,
+                y: (rect.height - dotDiameter) / 2,
+                width: dotDiameter,
+                height: dotDiameter
+            )
+            dotColor.setFill()
+            NSBezierPath(ovalIn: dotRect).fill()
+
+            return true
+        }
+        // Not template — we need the colored dot to render in color
+        image.isTemplate = false
+        return image
+    }
+
+    /// Renders a percentage text with an SF Symbol next to it.
+    private func renderPercentageWithSymbol(percentage: Int, symbolName: String) -> NSImage {
+        let text = "\(percentage)%"
+        let attributes = Self.percentageAttributes
+        let textSize = (text as NSString).size(withAttributes: attributes)
+
+        let symbolImage = symbol(named: symbolName)
+        let symbolSize = symbolImage?.size ?? NSSize(width: 12, height: 12)
+        let symbolSpacing: CGFloat = 3
+        let width = ceil(textSize.width + symbolSpacing + symbolSize.width + 2)
+
+        let image = NSImage(size: NSSize(width: width, height: Self.iconHeight), flipped: false) { rect in
+            // Draw percentage text
+            let textRect = NSRect(
+                x: 0,
+                y: (rect.height - textSize.height) / 2,
+                width: textSize.width,
+                height: textSize.height
+            )
+            (text as NSString).draw(in: textRect, withAttributes: attributes)
+
+            // Draw symbol
+            if let symbolImage {
+                let symbolRect = NSRect(
+                    x: textSize.width + symbolSpacing,
+                    y: (rect.height - symbolSize.height) / 2,
+                    width: symbolSize.width,
+                    height: symbolSize.height
+                )
+                symbolImage.draw(in: symbolRect)
+            }
+
+            return true
+        }
+        image.isTemplate = true
+        return image
+    }
+}
@@ -19,7 +19,11 @@ struct ZeitAppGUI: App {
 
 final class ZeitAppDelegate: NSObject, NSApplicationDelegate, NSMenuDelegate {
     private var statusItem: NSStatusItem!
-    private var popover: NSPopover!
+    /// Created on first click; most sessions never open it
+    private var popover: NSPopover?
+
+    private let statusIconRenderer = StatusIconRenderer()
+    private var lastStatusIconKey: StatusIconKey?
 
     // Onboarding panel — managed here (not in the popover's SwiftUI view)
     // because the popover isn't shown on launch, so its .onChange never fires.
@@ -58,9 +62,7 @@ final class ZeitAppDelegate: NSObject, NSApplicationDelegate, NSMenuDelegate {
 
     // MARK: - Tracking Lifecycle
 
-    private static let stopFlagPath: URL = FileManager.default
-        .homeDirectoryForCurrentUser
-        .appendingPathComponent(".local/share/zeit/.zeit_stop")
+    private static let stopFlagPath = ZeitConfig.stopFlagPath
 
     /// Creates the stop flag so the launchd tracker skips captures while the app is not running.
     private func stopTrackingOnQuit() {
@@ -86,13 +88,16 @@ final class ZeitAppDelegate: NSObject, NSApplicationDelegate, NSMenuDelegate {
             button.sendAction(on: [.leftMouseUp, .rightMouseUp])
             button.target = self
         }
+    }
 
-        popover = NSPopover()
+    private func makePopover() -> NSPopover {
+        let popover = NSPopover()
         popover.contentSize = NSSize(width: 300, height: 400)
         popover.behavior = .transient
         popover.contentViewController = NSHostingController(
             rootView: MenubarView(store: store)
         )
+        return popover
     }
 
     @objc private func statusItemClicked(_: Any?) {
@@ -106,6 +111,9 @@ final class ZeitAppDelegate: NSObject, NSApplicationDelegate, NSMenuDelegate {
     }
 
     private func togglePopover() {
+        let popover = popover ?? makePopover()
+        self.popover = popover
+
         if popover.isShown {
             popover.performClose(nil)
         } else if let button = statusItem.button {
@@ -153,111 +161,14 @@ final class ZeitAppDelegate: NSObject, NSApplicationDelegate, NSMenuDelegate {
     private func updateStatusItemIcon(trackingState: TrackingState, workPercentage: Double) {
         guard let button = statusItem.button else { return }
 
-        let percentage = Int(workPercentage)
+        let key = StatusIconKey(trackingState: trackingState, workPercentage: workPercentage)
 
-        switch trackingState {
-        case .beforeWorkHours:
-            button.image = NSImage(
-                systemSymbolName: "sun.max.fill",
-                accessibilityDescription: "Zeit - Before Work Hours"
-            )
-        case .active:
-            button.image = renderPercentageWithDot(percentage: percentage, dotColor: .systemGreen)
-        case .pausedManual:
-            button.image = renderPercentageWithDot(percentage: percentage, dotColor: .systemOrange)
-        case .afterWorkHours:
-            button.image = renderPercentageWithSymbol(
-                percentage: percentage,
-                symbolName: "moon.fill"
-            )
-        }
-    }
+        // Assigning the image relayouts and redraws the status item even if
+        // it's the same icon, so skip updates that wouldn't change anything
+        guard key != lastStatusIconKey else { return }
+        lastStatusIconKey = key
 
-    /// Renders a percentage text with a small colored dot indicator.
-    private func renderPercentageWithDot(percentage: Int, dotColor: NSColor) -> NSImage {
-        let text = "\(percentage)%"
-        let height: CGFloat = 16
-        let font = NSFont.monospacedDigitSystemFont(ofSize: 11, weight: .semibold)
-        let attributes: [NSAttributedString.Key: Any] = [
-            .font: font,
-            .foregroundColor: NSColor.headerTextColor,
-        ]
-        let textSize = (text as NSString).size(withAttributes: attributes)
-        let dotDiameter: CGFloat = 5
-        let dotSpacing: CGFloat = 3
-        let width = textSize.width + dotSpacing + dotDiameter + 2
-
-        let image = NSImage(size: NSSize(width: width, height: height), flipped: false) { rect in
-            // Draw percentage text
-            let textRect = NSRect(
-                x: 0,
-                y: (rect.height - textSize.height) / 2,
-                width: textSize.width,
-                height: textSize.height
-            )
-            (text as NSString).draw(in: textRect, withAttributes: attributes)
-
-            // Draw colored dot
-            let dotRect = NSRect(
-                x: textSize.width + dotSpacing,
-                y: (rect.height - dotDiameter) / 2,
-                width: dotDiameter,
-                height: dotDiameter
-            )
-            dotColor.setFill()
-            NSBezierPath(ovalIn: dotRect).fill()
-
-            return true
-        }
-        // Not template — we need the colored dot to render in color
-        image.isTemplate = false
-        return image
-    }
-
-    /// Renders a percentage text with an SF Symbol next to it.
-    private func renderPercentageWithSymbol(percentage: Int, symbolName: String) -> NSImage {
-        let text = "\(percentage)%"
-        let height: CGFloat = 16
-        let font = NSFont.monospacedDigitSystemFont(ofSize: 11, weight: .semibold)
-        let attributes: [NSAttributedString.Key: Any] = [
-            .font: font,
-            .foregroundColor: NSColor.headerTextColor,
-        ]
-        let textSize = (text as NSString).size(withAttributes: attributes)
-
-        let symbolConfig = NSImage.SymbolConfiguration(pointSize: 10, weight: .medium)
-        let symbolImage = NSImage(systemSymbolName: symbolName, accessibilityDescription: nil)?
-            .withSymbolConfiguration(symbolConfig)
-
-        let symbolSize = symbolImage?.size ?? NSSize(width: 12, height: 12)
-        let symbolSpacing: CGFloat = 3
-        let width = textSize.width + symbolSpacing + symbolSize.width + 2
-
-        let image = NSImage(size: NSSize(width: width, height: height), flipped: false) { rect in
-            // Draw percentage text
-            let textRect = NSRect(
-                x: 0,
-                y: (rect.height - textSize.height) / 2,
-                width: textSize.width,
-                height: textSize.height
-            )
-            (text as NSString).draw(in: textRect, withAttributes: attributes)
-
-            // Draw symbol
-            if let symbolImage {
-                let symbolRect = NSRect(
-                    x: textSize.width + symbolSpacing,
-                    y: (rect.height - symbolSize.height) / 2,
-                    width: symbolSize.width,
-                    height: symbolSize.height
-                )
-                symbolImage.draw(in: symbolRect)
-            }
-
-            return true
-        }
-        image.isTemplate = true
-        return image
+        button.image = statusIconRenderer.image(for: key)
     }
 
     // MARK: - Onboarding Panel
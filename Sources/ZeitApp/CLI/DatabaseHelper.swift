@@ -53,6 +53,14 @@ final class DatabaseHelper: @unchecked Sendable {
                     updated_at TEXT NOT NULL
                 )
                 """)
+            try db.execute(sql: """
+                CREATE TABLE IF NOT EXISTS day_summaries (
+                    date TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+                """)
         }
 
         // Auto-populate defaults if the activity_types table is empty
@@ -146,23 +154,23 @@ final class DatabaseHelper: @unchecked Sendable {
 
     func getAllDays() async throws -> [(date: String, count: Int)] {
         try await dbQueue.read { db in
-            let rows = try Row.fetchAll(
+            // Count in SQLite rather than deserializing every day's activities;
+            // rows that aren't a JSON array are skipped as before
+            let rows = try Row.fetchCursor(
                 db,
-                sql: "SELECT date, activities FROM daily_activities ORDER BY date DESC"
+                sql: """
+                    SELECT date, json_array_length(activities) AS count
+                    FROM daily_activities
+                    WHERE json_valid(activities) AND json_type(activities) = 'array'
+                    ORDER BY date DESC
+                    """
             )
 
-            return rows.compactMap { row -> (String, Int)? in
-                let date: String = row["date"]
-                let activitiesJson: String = row["activities"]
-
-                guard let data = activitiesJson.data(using: .utf8),
-                    let array = try? JSONSerialization.jsonObject(with: data) as? [[String: Any]]
-                else {
-                    return nil
-                }
-
-                return (date, array.count)
-            }
+            // Map rows as the statement steps instead of materializing
+            // every Row first
+            return try Array(rows.map { row -> (date: String, count: Int) in
+                (row["date"], row["count"])
+            })
         }
     }
 
@@ -286,6 +294,39 @@ final class DatabaseHelper: @unchecked Sendable {
         }
     }
 
+    // MARK: - Day Summaries
+
+    /// Get the cached summary for a date, if it was generated from the same inputs.
+    func getCachedDaySummary(date: String, contentHash: String) async throws -> DaySummary? {
+        try await dbQueue.read { db in
+            guard let json = try String.fetchOne(
+                db,
+                sql: "SELECT summary FROM day_summaries WHERE date = ? AND content_hash = ?",
+                arguments: [date, contentHash]
+            ), let data = json.data(using: .utf8) else {
+                return nil
+            }
+            return try? JSONDecoder().decode(DaySummary.self, from: data)
+        }
+    }
+
+    /// Cache a generated summary, replacing any previous one for the date.
+    func saveCachedDaySummary(_ summary: DaySummary, date: String, contentHash: String) async throws {
+        let now = ISO8601DateFormatter().string(from: Date())
+        let data = try JSONEncoder().encode(summary)
+        let json = String(data: data, encoding: .utf8) ?? "{}"
+
+        try await dbQueue.write { db in
+            try db.execute(
+                sql: """
+                    INSERT OR REPLACE INTO day_summaries (date, content_hash, summary, created_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                arguments: [date, contentHash, json, now]
+            )
+        }
+    }
+
     // MARK: - Parsing
 
     private func parseActivities(from json: String) throws -> [ActivityEntry] {
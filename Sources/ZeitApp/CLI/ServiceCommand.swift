@@ -65,9 +65,7 @@ struct ServiceStartCommand: ParsableCommand {
     )
 
     func run() throws {
-        let stopFlagPath = FileManager.default
-            .homeDirectoryForCurrentUser
-            .appendingPathComponent(".local/share/zeit/.zeit_stop")
+        let stopFlagPath = ZeitConfig.stopFlagPath
 
         if FileManager.default.fileExists(atPath: stopFlagPath.path) {
             try FileManager.default.removeItem(at: stopFlagPath)
@@ -87,9 +85,7 @@ struct ServiceStopCommand: ParsableCommand {
     )
 
     func run() throws {
-        let stopFlagPath = FileManager.default
-            .homeDirectoryForCurrentUser
-            .appendingPathComponent(".local/share/zeit/.zeit_stop")
+        let stopFlagPath = ZeitConfig.stopFlagPath
 
         FileManager.default.createFile(atPath: stopFlagPath.path, contents: nil)
         print("Tracking paused")
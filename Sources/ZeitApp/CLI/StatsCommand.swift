@@ -67,9 +67,10 @@ struct StatsCommand: AsyncParsableCommand {
             let category: String
         }
 
-        let workPct = stats.filter { $0.category == "work" }.reduce(0.0) { $0 + $1.percentage }
-        let personalPct = stats.filter { $0.category == "personal" }.reduce(0.0) { $0 + $1.percentage }
-        let idlePct = stats.filter { $0.category == "system" }.reduce(0.0) { $0 + $1.percentage }
+        let percentages = categoryPercentages(from: stats)
+        let workPct = percentages.work
+        let personalPct = percentages.personal
+        let idlePct = percentages.idle
 
         let output = StatsOutput(
             date: date,
@@ -98,9 +99,10 @@ struct StatsCommand: AsyncParsableCommand {
         print("=" .repeated(50))
         print("")
 
-        let workPct = stats.filter { $0.category == "work" }.reduce(0.0) { $0 + $1.percentage }
-        let personalPct = stats.filter { $0.category == "personal" }.reduce(0.0) { $0 + $1.percentage }
-        let idlePct = stats.filter { $0.category == "system" }.reduce(0.0) { $0 + $1.percentage }
+        let percentages = categoryPercentages(from: stats)
+        let workPct = percentages.work
+        let personalPct = percentages.personal
+        let idlePct = percentages.idle
 
         print("Summary:")
         print("  Total samples: \(total)")
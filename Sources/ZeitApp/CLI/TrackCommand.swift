@@ -61,15 +61,21 @@ struct TrackCommand: AsyncParsableCommand {
 
         do {
             let config = ZeitConfig.load()
+            let db = try DatabaseHelper()
+            let activityTypes = try await db.getActivityTypes()
             let identifier = ActivityIdentifier(
                 visionModel: config.models.vision,
                 textModel: config.models.text.model,
                 textProvider: config.models.text.provider
             )
             #if DEBUG
-            let result = try await identifier.identifyCurrentActivity(keepScreenshots: debug, debug: debug, sample: sample)
+            let result = try await identifier.identifyCurrentActivity(
+                keepScreenshots: debug, debug: debug, sample: sample, activityTypes: activityTypes
+            )
             #else
-            let result = try await identifier.identifyCurrentActivity(keepScreenshots: debug, debug: debug)
+            let result = try await identifier.identifyCurrentActivity(
+                keepScreenshots: debug, debug: debug, activityTypes: activityTypes
+            )
             #endif
 
             print("Activity: \(result.activity.displayName)")
@@ -95,7 +101,6 @@ struct TrackCommand: AsyncParsableCommand {
 
             // Save to database
             let entry = result.toActivityEntry()
-            let db = try DatabaseHelper()
             try await db.insertActivity(entry)
             print("Saved to database")
         } catch {
@@ -108,13 +113,7 @@ struct TrackCommand: AsyncParsableCommand {
 // MARK: - CLI Tracking Helper
 
 struct CLITrackingHelper {
-    private static let dataDir = FileManager.default
-        .homeDirectoryForCurrentUser
-        .appendingPathComponent(".local/share/zeit")
-
-    private static var stopFlagPath: URL {
-        dataDir.appendingPathComponent(".zeit_stop")
-    }
+    private static let stopFlagPath = ZeitConfig.stopFlagPath
 
     func isTrackingActive() -> Bool {
         !FileManager.default.fileExists(atPath: Self.stopFlagPath.path)
@@ -84,9 +84,8 @@ struct ViewAllCommand: AsyncParsableCommand {
         print("================")
         print("")
 
-        for (date, count) in days {
-            print("\(date): \(count) activities")
-        }
+        let lines = days.map { date, count in "\(date): \(count) activities" }
+        print(lines.joined(separator: "\n"))
     }
 }
 
@@ -104,9 +103,11 @@ struct ViewSummarizeCommand: AsyncParsableCommand {
     @Option(name: [.short, .long], help: "Override model in format 'provider:model' (e.g., 'openai:gpt-4o-mini')")
     var model: String?
 
+    @Flag(name: .long, help: "Regenerate the summary even if a cached one exists")
+    var refresh: Bool = false
+
     func run() async throws {
         let targetDate = date ?? DateHelpers.todayString()
-        print("Generating summary for \(targetDate)...")
 
         let db = try DatabaseHelper()
 
@@ -128,15 +129,40 @@ struct ViewSummarizeCommand: AsyncParsableCommand {
             modelName = config.models.text.model
         }
 
-        let llmProvider = try LLMProviderFactory.create(provider: providerName, model: modelName)
-        let summarizer = DaySummarizer(provider: llmProvider)
-
-        guard let result = try await summarizer.summarize(
+        // Reuse the stored summary when activities, objectives and model are unchanged
+        let cacheKey = DaySummarizer.cacheKey(
             activities: record.activities,
-            objectives: objectives
-        ) else {
-            print("No non-idle activities recorded for \(targetDate)")
-            return
+            objectives: objectives,
+            model: "\(providerName):\(modelName)"
+        )
+        let cached = refresh
+            ? nil
+            : try await db.getCachedDaySummary(date: targetDate, contentHash: cacheKey)
+
+        let result: DaySummary
+        if let cached {
+            result = cached
+        } else {
+            print("Generating summary for \(targetDate)...")
+
+            let llmProvider = try LLMProviderFactory.create(provider: providerName, model: modelName)
+            let summarizer = DaySummarizer(provider: llmProvider)
+
+            guard let summary = try await summarizer.summarize(
+                activities: record.activities,
+                objectives: objectives
+            ) else {
+                print("No non-idle activities recorded for \(targetDate)")
+                return
+            }
+            // Caching is best-effort; the tracker may hold the database lock,
+            // and a failed write shouldn't throw away a summary we already have
+            do {
+                try await db.saveCachedDaySummary(summary, date: targetDate, contentHash: cacheKey)
+            } catch {
+                print("Could not cache summary: \(error.localizedDescription)")
+            }
+            result = summary
         }
 
         let timeFormatter = DateFormatter()
@@ -310,17 +336,25 @@ struct DeleteObjectivesCommand: AsyncParsableCommand {
 // MARK: - Helpers
 
 enum DateHelpers {
-    static func todayString() -> String {
+    /// Shared "yyyy-MM-dd" formatter; the menubar asks for today's date on
+    /// every refresh, so don't rebuild a formatter each time. It lives for the
+    /// whole menubar process, so follow time zone changes instead of keeping
+    /// the zone it was created in, and pin the locale so the format is fixed.
+    private static let dayFormatter: DateFormatter = {
         let formatter = DateFormatter()
+        formatter.locale = Locale(identifier: "en_US_POSIX")
+        formatter.timeZone = .autoupdatingCurrent
         formatter.dateFormat = "yyyy-MM-dd"
-        return formatter.string(from: Date())
+        return formatter
+    }()
+
+    static func todayString() -> String {
+        dayFormatter.string(from: Date())
     }
 
     static func yesterdayString() -> String {
-        let formatter = DateFormatter()
-        formatter.dateFormat = "yyyy-MM-dd"
         let yesterday = Calendar.current.date(byAdding: .day, value: -1, to: Date())!
-        return formatter.string(from: yesterday)
+        return dayFormatter.string(from: yesterday)
     }
 }
 
@@ -344,6 +378,11 @@ enum ViewHelpers {
         let activityTypes = try await db.getActivityTypes()
         let workIDs = Set(activityTypes.filter(\.isWork).map(\.id))
 
+        // Build all rows first and write them in one call; large days otherwise
+        // pay for a separate print per activity.
+        var lines: [String] = []
+        lines.reserveCapacity(record.activities.count)
+
         for entry in record.activities {
             let timeStr: String
             if let entryDate = isoFormatter.date(from: entry.timestamp) {
@@ -354,20 +393,25 @@ enum ViewHelpers {
 
             let icon = workIDs.contains(entry.activity.rawValue) ? "💼" : (entry.activity == .idle ? "😴" : "🏠")
             if let description = entry.description {
-                print("\(timeStr) \(icon) \(entry.activity.displayName) — \(description)")
+                lines.append("\(timeStr) \(icon) \(entry.activity.displayName) — \(description)")
             } else {
-                print("\(timeStr) \(icon) \(entry.activity.displayName)")
+                lines.append("\(timeStr) \(icon) \(entry.activity.displayName)")
             }
         }
 
+        if !lines.isEmpty {
+            print(lines.joined(separator: "\n"))
+        }
+
         print("")
         print("Total: \(record.count) activities")
 
         // Calculate breakdown
         let stats = computeActivityBreakdown(from: record.activities, activityTypes: activityTypes)
-        let workPct = stats.filter { $0.category == "work" }.reduce(0.0) { $0 + $1.percentage }
-        let personalPct = stats.filter { $0.category == "personal" }.reduce(0.0) { $0 + $1.percentage }
-        let idlePct = stats.filter { $0.category == "system" }.reduce(0.0) { $0 + $1.percentage }
+        let percentages = categoryPercentages(from: stats)
+        let workPct = percentages.work
+        let personalPct = percentages.personal
+        let idlePct = percentages.idle
 
         print("Work: \(String(format: "%.1f", workPct))% | Personal: \(String(format: "%.1f", personalPct))% | Idle: \(String(format: "%.1f", idlePct))%")
     }
@@ -10,9 +10,19 @@ struct DatabaseClient: Sendable {
     /// Get activities for a specific date (YYYY-MM-DD format)
     var getDayRecord: @Sendable (_ date: String) async throws -> DayRecord?
 
+    /// Get the activity count and last activity timestamp for a date without
+    /// decoding the activities
+    var getDayRecordSummary: @Sendable (_ date: String) async throws -> (count: Int, lastTimestamp: String?)?
+
+    /// Append an activity to today's record
+    var insertActivity: @Sendable (_ entry: ActivityEntry) async throws -> Void
+
     /// Get all days with activity counts, sorted by date descending
     var getAllDays: @Sendable () async throws -> [(date: String, count: Int)]
 
+    /// Get a day's activities and objectives in a single read
+    var getDayBundle: @Sendable (_ date: String) async throws -> (record: DayRecord?, objectives: DayObjectives?)
+
     /// Get objectives for a specific date
     var getDayObjectives: @Sendable (_ date: String) async throws -> DayObjectives?
 
@@ -34,6 +44,12 @@ struct DatabaseClient: Sendable {
 
     /// Save activity types (replaces all existing types)
     var saveActivityTypes: @Sendable (_ types: [ActivityType]) async throws -> Void
+
+    /// Modification date of the database file, `nil` if it doesn't exist yet
+    var lastModified: @Sendable () -> Date? = { nil }
+
+    /// Observe writes to the database and data directory (including the stop flag)
+    var observeChanges: @Sendable () -> AsyncStream<Void> = { .never }
 }
 
 // MARK: - Dependency Registration
@@ -55,9 +71,18 @@ extension DatabaseClient: DependencyKey {
             getDayRecord: { date in
                 try await actor.getDayRecord(date: date)
             },
+            getDayRecordSummary: { date in
+                try await actor.getDayRecordSummary(date: date)
+            },
+            insertActivity: { entry in
+                try await actor.insertActivity(entry)
+            },
             getAllDays: {
                 try await actor.getAllDays()
             },
+            getDayBundle: { date in
+                try await actor.getDayBundle(date: date)
+            },
             getDayObjectives: { date in
                 try await actor.getDayObjectives(date: date)
             },
@@ -75,6 +100,14 @@ extension DatabaseClient: DependencyKey {
             },
             saveActivityTypes: { types in
                 try await actor.saveActivityTypes(types)
+            },
+            lastModified: {
+                let attributes = try? FileManager.default
+                    .attributesOfItem(atPath: DatabaseActor.databaseURL.path)
+                return attributes?[.modificationDate] as? Date
+            },
+            observeChanges: {
+                dataDirectoryChanges()
             }
         )
     }()
@@ -83,6 +116,8 @@ extension DatabaseClient: DependencyKey {
 // MARK: - Database Actor
 
 private actor DatabaseActor {
+    static let databaseURL = ZeitConfig.dataDir.appendingPathComponent("zeit.db")
+
     private var dbQueue: DatabaseQueue?
 
     private func getDatabase() throws -> DatabaseQueue {
@@ -90,9 +125,7 @@ private actor DatabaseActor {
             return db
         }
 
-        let dbPath = FileManager.default
-            .homeDirectoryForCurrentUser
-            .appendingPathComponent(".local/share/zeit/zeit.db")
+        let dbPath = Self.databaseURL
 
         // Ensure the parent directory exists
         let dir = dbPath.deletingLastPathComponent()
@@ -134,6 +167,14 @@ private actor DatabaseActor {
                     updated_at TEXT NOT NULL
                 )
                 """)
+            try db.execute(sql: """
+                CREATE TABLE IF NOT EXISTS day_summaries (
+                    date TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+                """)
         }
 
         // Auto-populate defaults if the activity_types table is empty
@@ -216,66 +257,103 @@ private actor DatabaseActor {
         let db = try getDatabase()
 
         return try await db.read { [self] db in
+            try self.fetchDayRecord(db, date: date)
+        }
+    }
+
+    func getDayBundle(date: String) async throws -> (record: DayRecord?, objectives: DayObjectives?) {
+        let db = try getDatabase()
+
+        return try await db.read { [self] db in
+            (try self.fetchDayRecord(db, date: date), try self.fetchDayObjectives(db, date: date))
+        }
+    }
+
+    func getDayRecordSummary(date: String) async throws -> (count: Int, lastTimestamp: String?)? {
+        let db = try getDatabase()
+
+        return try await db.read { db in
             guard let row = try Row.fetchOne(
                 db,
-                sql: "SELECT date, activities FROM daily_activities WHERE date = ?",
+                sql: """
+                    SELECT json_array_length(activities) AS count,
+                           json_extract(activities, '$[#-1].timestamp') AS last_timestamp
+                    FROM daily_activities WHERE date = ?
+                    """,
                 arguments: [date]
             ) else {
                 return nil
             }
 
-            let activitiesJson: String = row["activities"]
-            let activities = try self.parseActivities(from: activitiesJson)
-            return DayRecord(date: date, activities: activities)
+            return (row["count"], row["last_timestamp"])
         }
     }
 
-    func getAllDays() async throws -> [(date: String, count: Int)] {
+    func insertActivity(_ entry: ActivityEntry) async throws {
         let db = try getDatabase()
+        let today = DateHelpers.todayString()
+        let now = ISO8601DateFormatter().string(from: Date())
 
-        return try await db.read { db in
-            let rows = try Row.fetchAll(
+        try await db.write { [self] db in
+            if let row = try Row.fetchOne(
                 db,
-                sql: "SELECT date, activities FROM daily_activities ORDER BY date DESC"
-            )
-
-            return rows.compactMap { row -> (String, Int)? in
-                let date: String = row["date"]
+                sql: "SELECT activities FROM daily_activities WHERE date = ?",
+                arguments: [today]
+            ) {
+                // Append to existing activities
                 let activitiesJson: String = row["activities"]
+                var activities = (try? self.parseActivities(from: activitiesJson)) ?? []
+                activities.append(entry)
 
-                guard let data = activitiesJson.data(using: .utf8),
-                    let array = try? JSONSerialization.jsonObject(with: data) as? [[String: Any]]
-                else {
-                    return nil
-                }
-
-                return (date, array.count)
+                try db.execute(
+                    sql: """
+                        UPDATE daily_activities
+                        SET activities = ?, updated_at = ?
+                        WHERE date = ?
+                        """,
+                    arguments: [try self.encodeActivities(activities), now, today]
+                )
+            } else {
+                try db.execute(
+                    sql: """
+                        INSERT INTO daily_activities (date, activities, created_at, updated_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                    arguments: [today, try self.encodeActivities([entry]), now, now]
+                )
             }
         }
     }
 
-    func getDayObjectives(date: String) async throws -> DayObjectives? {
+    func getAllDays() async throws -> [(date: String, count: Int)] {
         let db = try getDatabase()
 
-        return try await db.read { [self] db in
-            guard let row = try Row.fetchOne(
+        return try await db.read { db in
+            // Count in SQLite rather than deserializing every day's activities;
+            // rows that aren't a JSON array are skipped as before
+            let rows = try Row.fetchCursor(
                 db,
-                sql: "SELECT * FROM day_objectives WHERE date = ?",
-                arguments: [date]
-            ) else {
-                return nil
-            }
+                sql: """
+                    SELECT date, json_array_length(activities) AS count
+                    FROM daily_activities
+                    WHERE json_valid(activities) AND json_type(activities) = 'array'
+                    ORDER BY date DESC
+                    """
+            )
+
+            // Map rows as the statement steps instead of materializing
+            // every Row first
+            return try Array(rows.map { row -> (date: String, count: Int) in
+                (row["date"], row["count"])
+            })
+        }
+    }
 
-            let secondaryJson: String = row["secondary_objectives"]
-            let secondary = self.parseSecondaryObjectives(from: secondaryJson)
+    func getDayObjectives(date: String) async throws -> DayObjectives? {
+        let db = try getDatabase()
 
-            return DayObjectives(
-                date: row["date"],
-                mainObjective: row["main_objective"],
-                secondaryObjectives: secondary,
-                createdAt: row["created_at"],
-                updatedAt: row["updated_at"]
-            )
+        return try await db.read { [self] db in
+            try self.fetchDayObjectives(db, date: date)
         }
     }
 
@@ -339,6 +417,43 @@ private actor DatabaseActor {
         }
     }
 
+    // MARK: - Fetch Helpers
+
+    nonisolated private func fetchDayRecord(_ db: Database, date: String) throws -> DayRecord? {
+        guard let row = try Row.fetchOne(
+            db,
+            sql: "SELECT date, activities FROM daily_activities WHERE date = ?",
+            arguments: [date]
+        ) else {
+            return nil
+        }
+
+        let activitiesJson: String = row["activities"]
+        let activities = try parseActivities(from: activitiesJson)
+        return DayRecord(date: date, activities: activities)
+    }
+
+    nonisolated private func fetchDayObjectives(_ db: Database, date: String) throws -> DayObjectives? {
+        guard let row = try Row.fetchOne(
+            db,
+            sql: "SELECT * FROM day_objectives WHERE date = ?",
+            arguments: [date]
+        ) else {
+            return nil
+        }
+
+        let secondaryJson: String = row["secondary_objectives"]
+        let secondary = parseSecondaryObjectives(from: secondaryJson)
+
+        return DayObjectives(
+            date: row["date"],
+            mainObjective: row["main_objective"],
+            secondaryObjectives: secondary,
+            createdAt: row["created_at"],
+            updatedAt: row["updated_at"]
+        )
+    }
+
     // MARK: - Parsing Helpers
 
     nonisolated private func parseActivities(from json: String) throws -> [ActivityEntry] {
@@ -350,6 +465,11 @@ private actor DatabaseActor {
         return try decoder.decode([ActivityEntry].self, from: data)
     }
 
+    nonisolated private func encodeActivities(_ activities: [ActivityEntry]) throws -> String {
+        let data = try JSONEncoder().encode(activities)
+        return String(data: data, encoding: .utf8) ?? "[]"
+    }
+
     nonisolated private func parseSecondaryObjectives(from json: String) -> [String] {
         guard let data = json.data(using: .utf8),
             let array = try? JSONDecoder().decode([String].self, from: data)
@@ -360,6 +480,41 @@ private actor DatabaseActor {
     }
 }
 
+// MARK: - Data Directory Observer
+
+/// Stream an event whenever the data directory or the database file is written.
+///
+/// Every database write creates and removes the rollback journal next to
+/// `zeit.db`, and the stop flag lives in the same directory, so watching the
+/// directory catches both; the file itself is watched for in-place writes.
+private func dataDirectoryChanges() -> AsyncStream<Void> {
+    AsyncStream { continuation in
+        let paths = [
+            ZeitConfig.dataDir.path,
+            DatabaseActor.databaseURL.path,
+        ]
+
+        let sources = paths.compactMap { path -> DispatchSourceFileSystemObject? in
+            let descriptor = open(path, O_EVTONLY)
+            guard descriptor >= 0 else { return nil }
+
+            let source = DispatchSource.makeFileSystemObjectSource(
+                fileDescriptor: descriptor,
+                eventMask: [.write, .extend, .delete, .rename],
+                queue: .global(qos: .utility)
+            )
+            source.setEventHandler { continuation.yield() }
+            source.setCancelHandler { close(descriptor) }
+            source.resume()
+            return source
+        }
+
+        continuation.onTermination = { _ in
+            sources.forEach { $0.cancel() }
+        }
+    }
+}
+
 // MARK: - Errors
 
 enum DatabaseError: LocalizedError {
@@ -36,14 +36,21 @@ extension DependencyValues {
 // MARK: - Live Implementation
 
 extension NotificationClient: DependencyKey {
-    static let liveValue = NotificationClient(
-        show: { title, subtitle, body in
+    static let liveValue: NotificationClient = {
+        // Authorization only needs checking until it has been settled once;
+        // after that every notification would re-query the same settings
+        let authorizationChecked = LockIsolated(false)
+
+        @Sendable func deliver(_ title: String, _ subtitle: String, _ body: String, actionURL: URL?) async {
             let center = UNUserNotificationCenter.current()
 
             // Request authorization if needed
-            let settings = await center.notificationSettings()
-            if settings.authorizationStatus == .notDetermined {
-                _ = try? await center.requestAuthorization(options: [.alert, .sound])
+            if !authorizationChecked.value {
+                let settings = await center.notificationSettings()
+                if settings.authorizationStatus == .notDetermined {
+                    _ = try? await center.requestAuthorization(options: [.alert, .sound])
+                }
+                authorizationChecked.setValue(true)
             }
 
             // Create and deliver notification
@@ -52,6 +59,9 @@ extension NotificationClient: DependencyKey {
             content.subtitle = subtitle
             content.body = body
             content.sound = .default
+            if let actionURL {
+                content.userInfo = ["actionURL": actionURL.absoluteString]
+            }
 
             let request = UNNotificationRequest(
                 identifier: UUID().uuidString,
@@ -60,31 +70,17 @@ extension NotificationClient: DependencyKey {
             )
 
             try? await center.add(request)
-        },
-        showWithAction: { title, subtitle, body, actionURL in
-            let center = UNUserNotificationCenter.current()
+        }
 
-            let settings = await center.notificationSettings()
-            if settings.authorizationStatus == .notDetermined {
-                _ = try? await center.requestAuthorization(options: [.alert, .sound])
+        return NotificationClient(
+            show: { title, subtitle, body in
+                await deliver(title, subtitle, body, actionURL: nil)
+            },
+            showWithAction: { title, subtitle, body, actionURL in
+                await deliver(title, subtitle, body, actionURL: actionURL)
             }
-
-            let content = UNMutableNotificationContent()
-            content.title = title
-            content.subtitle = subtitle
-            content.body = body
-            content.sound = .default
-            content.userInfo = ["actionURL": actionURL.absoluteString]
-
-            let request = UNNotificationRequest(
-                identifier: UUID().uuidString,
-                content: content,
-                trigger: nil
-            )
-
-            try? await center.add(request)
-        }
-    )
+        )
+    }()
 }
 
 // MARK: - Notification Delegate
@@ -11,6 +11,16 @@ enum PermissionStatus: Equatable, Sendable {
     case denied
 }
 
+/// Status of every permission the tracker needs, from a single check.
+struct PermissionStatuses: Equatable, Sendable {
+    var screenRecording: PermissionStatus
+    var accessibility: PermissionStatus
+
+    var allGranted: Bool {
+        screenRecording == .granted && accessibility == .granted
+    }
+}
+
 // MARK: - App Activation Events
 
 enum AppActivation: Sendable {
@@ -44,6 +54,11 @@ struct PermissionsClient: Sendable {
     /// Check Accessibility permission status (for the CLI, not this app)
     var accessibilityStatus: @Sendable () -> PermissionStatus = { .notDetermined }
 
+    /// Check all permissions at once; runs the CLI's doctor check a single time
+    var statuses: @Sendable () -> PermissionStatuses = {
+        PermissionStatuses(screenRecording: .notDetermined, accessibility: .notDetermined)
+    }
+
     /// Open System Settings to Screen Recording panel
     var openScreenRecordingSettings: @Sendable () async -> Void
 
@@ -52,6 +67,9 @@ struct PermissionsClient: Sendable {
 
     /// Observe app activation events (for re-checking permissions after Settings)
     var observeAppActivation: @Sendable () -> AsyncStream<AppActivation> = { .never }
+
+    /// Observe system notifications posted when privacy permissions may have changed
+    var observePermissionChanges: @Sendable () -> AsyncStream<Void> = { .never }
 }
 
 // MARK: - Dependency Registration
@@ -81,6 +99,9 @@ extension PermissionsClient: DependencyKey {
                 // Check if CLI has accessibility permission
                 helper.checkAccessibility()
             },
+            statuses: {
+                helper.checkAll()
+            },
             openScreenRecordingSettings: {
                 await MainActor.run {
                     if let url = URL(string: SettingsURL.screenRecording) {
@@ -97,6 +118,9 @@ extension PermissionsClient: DependencyKey {
             },
             observeAppActivation: {
                 observer.stream
+            },
+            observePermissionChanges: {
+                permissionChanges()
             }
         )
     }()
@@ -151,25 +175,29 @@ private struct PermissionsHelper: Sendable {
         guard let result = runDoctorCheck() else {
             return .notDetermined
         }
+        return status(named: "Screen Recording", in: result)
+    }
 
-        if let check = result.checks.first(where: { $0.name.contains("Screen Recording") }) {
-            return check.passed ? .granted : .denied
-        }
-
-        // Dev mode - permissions check was skipped
-        if result.checks.contains(where: { $0.details.contains("Skipped") }) {
+    func checkAccessibility() -> PermissionStatus {
+        guard let result = runDoctorCheck() else {
             return .notDetermined
         }
-
-        return .notDetermined
+        return status(named: "Accessibility", in: result)
     }
 
-    func checkAccessibility() -> PermissionStatus {
+    /// Check both permissions from one `zeit doctor` run
+    func checkAll() -> PermissionStatuses {
         guard let result = runDoctorCheck() else {
-            return .notDetermined
+            return PermissionStatuses(screenRecording: .notDetermined, accessibility: .notDetermined)
         }
+        return PermissionStatuses(
+            screenRecording: status(named: "Screen Recording", in: result),
+            accessibility: status(named: "Accessibility", in: result)
+        )
+    }
 
-        if let check = result.checks.first(where: { $0.name.contains("Accessibility") }) {
+    private func status(named name: String, in result: DoctorResult) -> PermissionStatus {
+        if let check = result.checks.first(where: { $0.name.contains(name) }) {
             return check.passed ? .granted : .denied
         }
 
@@ -230,11 +258,36 @@ private final class AppActivationObserver: @unchecked Sendable {
     }
 }
 
+// MARK: - Permission Change Observer
+
+/// Stream an event whenever the system announces an accessibility trust change.
+///
+/// macOS posts `com.apple.accessibility.api` on the distributed notification
+/// center when an app is added to or removed from the Accessibility list.
+/// There is no equivalent for Screen Recording, so callers still need a slow
+/// fallback poll.
+private func permissionChanges() -> AsyncStream<Void> {
+    AsyncStream { continuation in
+        let center = DistributedNotificationCenter.default()
+        let token = center.addObserver(
+            forName: NSNotification.Name("com.apple.accessibility.api"),
+            object: nil,
+            queue: nil
+        ) { _ in
+            continuation.yield()
+        }
+
+        continuation.onTermination = { _ in
+            center.removeObserver(token)
+        }
+    }
+}
+
 // MARK: - Convenience
 
 extension PermissionsClient {
     /// Check if all required permissions are granted
     func allPermissionsGranted() -> Bool {
-        screenRecordingStatus() == .granted && accessibilityStatus() == .granted
+        statuses().allGranted
     }
 }
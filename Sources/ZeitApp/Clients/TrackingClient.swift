@@ -66,21 +66,17 @@ extension TrackingClient: DependencyKey {
 // MARK: - Helper
 
 private struct TrackingHelper: Sendable {
-    private static let dataDir = FileManager.default
-        .homeDirectoryForCurrentUser
-        .appendingPathComponent(".local/share/zeit")
-
-    private static var stopFlagPath: URL {
-        dataDir.appendingPathComponent(".zeit_stop")
-    }
+    private static let stopFlagPath = ZeitConfig.stopFlagPath
 
     func isTrackingActive() -> Bool {
         !FileManager.default.fileExists(atPath: Self.stopFlagPath.path)
     }
 
     func isWithinWorkHours() -> Bool {
-        let config = loadConfig()
+        isWithinWorkHours(loadConfig())
+    }
 
+    private func isWithinWorkHours(_ config: ZeitConfig.WorkHoursConfig) -> Bool {
         let calendar = Calendar.current
         let now = Date()
         let hour = calendar.component(.hour, from: now)
@@ -101,8 +97,10 @@ private struct TrackingHelper: Sendable {
     }
 
     func getWorkHoursMessage() -> String {
-        let config = loadConfig()
+        getWorkHoursMessage(loadConfig())
+    }
 
+    private func getWorkHoursMessage(_ config: ZeitConfig.WorkHoursConfig) -> String {
         let calendar = Calendar.current
         let now = Date()
         let hour = calendar.component(.hour, from: now)
@@ -146,29 +144,24 @@ private struct TrackingHelper: Sendable {
         FileManager.default.createFile(atPath: path.path, contents: nil)
     }
 
+    /// Compute the tracking state from one config load.
     func getTrackingState() -> TrackingState {
-        let withinWorkHours = isWithinWorkHours()
-        let manuallyStopped = !isTrackingActive()
+        let config = loadConfig()
 
-        if !withinWorkHours {
-            let message = getWorkHoursMessage()
-            if isBeforeWorkHours() {
+        if !isWithinWorkHours(config) {
+            let message = getWorkHoursMessage(config)
+            if isBeforeWorkHours(config) {
                 return .beforeWorkHours(message: message)
             } else {
                 return .afterWorkHours(message: message)
             }
         }
 
-        if manuallyStopped {
-            return .pausedManual
-        }
-
-        return .active
+        return isTrackingActive() ? .active : .pausedManual
     }
 
     /// Whether the current time is before work hours start (on a work day)
-    func isBeforeWorkHours() -> Bool {
-        let config = loadConfig()
+    private func isBeforeWorkHours(_ config: ZeitConfig.WorkHoursConfig) -> Bool {
         let calendar = Calendar.current
         let now = Date()
         let hour = calendar.component(.hour, from: now)
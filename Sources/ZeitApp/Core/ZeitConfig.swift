@@ -1,4 +1,5 @@
 import Foundation
+import os
 import Yams
 
 /// Shared configuration loaded from ~/.local/share/zeit/conf.yml
@@ -89,6 +90,9 @@ struct ZeitConfig: Sendable {
         dataDir.appendingPathComponent("conf.yml")
     }
 
+    /// While this file exists the tracker skips captures
+    static let stopFlagPath = dataDir.appendingPathComponent(".zeit_stop")
+
     // MARK: - Default Config Content
 
     private static let defaultConfigYAML = """
@@ -132,13 +136,26 @@ struct ZeitConfig: Sendable {
 
     // MARK: - Loading
 
+    /// Last parsed config and the modification date of the file it came from
+    private static let cache = OSAllocatedUnfairLock<(modifiedAt: Date, config: ZeitConfig)?>(initialState: nil)
+
     /// Load configuration from conf.yml, falling back to defaults for missing values.
+    ///
+    /// The parsed config is reused until the file's modification date changes,
+    /// so repeated calls don't re-read or re-parse the file.
     static func load() -> ZeitConfig {
         ensureSetup()
 
         let path = configPath
+        let modifiedAt = (try? FileManager.default.attributesOfItem(atPath: path.path))?[.modificationDate] as? Date
 
-        guard FileManager.default.fileExists(atPath: path.path),
+        if let modifiedAt,
+           let cached = cache.withLock({ $0 }),
+           cached.modifiedAt == modifiedAt {
+            return cached.config
+        }
+
+        guard modifiedAt != nil,
               let contents = try? String(contentsOf: path, encoding: .utf8),
               let yaml = try? Yams.load(yaml: contents) as? [String: Any]
         else {
@@ -147,8 +164,12 @@ struct ZeitConfig: Sendable {
 
         let workHours = parseWorkHours(from: yaml)
         let models = parseModels(from: yaml)
+        let config = ZeitConfig(workHours: workHours, models: models)
 
-        return ZeitConfig(workHours: workHours, models: models)
+        if let modifiedAt {
+            cache.withLock { $0 = (modifiedAt, config) }
+        }
+        return config
     }
 
     // MARK: - Parsing
@@ -290,5 +311,8 @@ struct ZeitConfig: Sendable {
 
         let output = try Yams.dump(object: yaml)
         try output.write(to: path, atomically: true, encoding: .utf8)
+        // Don't rely on the mtime alone; two saves within the filesystem's
+        // timestamp resolution would otherwise look unchanged
+        cache.withLock { $0 = nil }
     }
 }
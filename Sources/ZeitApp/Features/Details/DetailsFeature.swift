@@ -6,8 +6,23 @@ struct DetailsFeature {
     @ObservableState
     struct State: Equatable {
         var date: String
-        var stats: [ActivityStat]
-        var totalActivities: Int
+        let stats: [ActivityStat]
+        let totalActivities: Int
+
+        // Derived once here rather than on every render of the panel; the
+        // stats they come from are immutable, so they can't drift out of sync
+        let workStats: [ActivityStat]
+        let personalStats: [ActivityStat]
+        let totalTrackedMinutes: Int
+
+        init(date: String, stats: [ActivityStat], totalActivities: Int) {
+            self.date = date
+            self.stats = stats
+            self.totalActivities = totalActivities
+            self.workStats = stats.filter(\.isWork)
+            self.personalStats = stats.filter { !$0.isWork }
+            self.totalTrackedMinutes = stats.reduce(0) { $0 + $1.count }
+        }
     }
 
     enum Action {
@@ -4,27 +4,15 @@ import SwiftUI
 struct DetailsView: View {
     let store: StoreOf<DetailsFeature>
 
-    private var totalTrackedMinutes: Int {
-        store.stats.reduce(0) { $0 + $1.count }
-    }
-
     private var formattedTrackedTime: String {
-        let hours = totalTrackedMinutes / 60
-        let minutes = totalTrackedMinutes % 60
+        let hours = store.totalTrackedMinutes / 60
+        let minutes = store.totalTrackedMinutes % 60
         if hours > 0 {
             return "\(hours)h \(minutes)m"
         }
         return "\(minutes)m"
     }
 
-    private var workStats: [ActivityStat] {
-        store.stats.filter { $0.isWork }
-    }
-
-    private var personalStats: [ActivityStat] {
-        store.stats.filter { !$0.isWork }
-    }
-
     var body: some View {
         VStack(alignment: .leading, spacing: 16) {
             // Header
@@ -76,12 +64,12 @@ struct DetailsView: View {
             // Activity breakdown
             ScrollView {
                 VStack(alignment: .leading, spacing: 16) {
-                    if !workStats.isEmpty {
-                        ActivitySection(title: "Work", stats: workStats, isWork: true)
+                    if !store.workStats.isEmpty {
+                        ActivitySection(title: "Work", stats: store.workStats, isWork: true)
                     }
 
-                    if !personalStats.isEmpty {
-                        ActivitySection(title: "Personal", stats: personalStats, isWork: false)
+                    if !store.personalStats.isEmpty {
+                        ActivitySection(title: "Personal", stats: store.personalStats, isWork: false)
                     }
                 }
             }
@@ -100,10 +88,11 @@ private struct ActivitySection: View {
     let stats: [ActivityStat]
     let isWork: Bool
 
+    private static let workColor = Color(red: 0.2, green: 0.7, blue: 0.6)
+    private static let personalColor = Color(red: 0.6, green: 0.4, blue: 0.8)
+
     private var sectionColor: Color {
-        isWork
-            ? Color(red: 0.2, green: 0.7, blue: 0.6)
-            : Color(red: 0.6, green: 0.4, blue: 0.8)
+        isWork ? Self.workColor : Self.personalColor
     }
 
     var body: some View {
@@ -130,12 +119,17 @@ private struct ActivitySection: View {
 
 // MARK: - Activity Row
 
-private struct ActivityRow: View {
+/// Equatable on its inputs so SwiftUI skips rows whose stat didn't change.
+private struct ActivityRow: View, Equatable {
     let stat: ActivityStat
     let color: Color
 
     @State private var isHovered = false
 
+    static func == (lhs: ActivityRow, rhs: ActivityRow) -> Bool {
+        lhs.stat == rhs.stat && lhs.color == rhs.color
+    }
+
     var body: some View {
         VStack(alignment: .leading, spacing: 5) {
             HStack {
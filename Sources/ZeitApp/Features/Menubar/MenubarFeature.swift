@@ -1,5 +1,11 @@
 import ComposableArchitecture
 import Foundation
+import os
+
+private let logger = Logger(subsystem: "com.zeit", category: "MenubarFeature")
+
+/// Refreshes slower than this are logged, to find what stalls the popover
+private let slowRefreshThreshold: Duration = .milliseconds(50)
 
 struct ForceTrackInfo: Equatable {
     let activityName: String
@@ -13,6 +19,21 @@ struct SampleInfo: Equatable {
 }
 #endif
 
+/// Identifies the activity list that `todayStats` was computed from.
+struct StatsKey: Equatable {
+    let date: String
+    let count: Int
+    let lastTimestamp: String?
+}
+
+/// Everything a periodic refresh depends on; if none of it changed since the
+/// last tick there is nothing new to load.
+struct RefreshSignature: Equatable {
+    let date: String
+    let databaseModifiedAt: Date?
+    let trackingState: TrackingState
+}
+
 @Reducer
 struct MenubarFeature {
     @ObservableState
@@ -21,6 +42,8 @@ struct MenubarFeature {
         var todayStats: [ActivityStat] = []
         var totalActivities: Int = 0
         var workPercentage: Double = 0
+        var statsKey: StatsKey?
+        var refreshSignature: RefreshSignature?
         var todayDate: String = ""
         var dayObjectives: DayObjectives?
 
@@ -33,6 +56,9 @@ struct MenubarFeature {
         // Settings
         var launchAtLogin: Bool = false
 
+        // Tracking toggle in flight
+        var isTogglingTracking: Bool = false
+
         // Force track
         var isForceTracking: Bool = false
 
@@ -47,22 +73,30 @@ struct MenubarFeature {
 
         // Loading state
         var isLoading: Bool = false
+        /// A refresh was requested while another was loading
+        var isRefreshPending: Bool = false
     }
 
     enum Action {
         // Lifecycle
         case task
         case refreshTick
+        case dataDirectoryChanged
+        case refreshChecked(RefreshSignature)
         case refreshData
+        case launchAtLoginLoaded(Bool)
+        case permissionsChecked(allGranted: Bool)
         case modelsCheckCompleted(allDownloaded: Bool)
 
         // Data responses
-        case dataLoaded(DayRecord?, DayObjectives?)
+        case dataLoaded(DayRecord?, DayObjectives?, TrackingState)
+        case dataUnchanged(DayObjectives?, TrackingState)
+        case dataLoadFailed(TrackingState)
         case trackingStateUpdated(TrackingState)
 
         // User actions
         case toggleTracking
-        case trackingToggled(Result<Void, Error>)
+        case trackingToggled(Result<TrackingState, Error>)
         case showDetails
         case showObjectives
         case toggleLaunchAtLogin
@@ -95,7 +129,7 @@ struct MenubarFeature {
     @Dependency(\.modelClient) var modelClient
     @Dependency(\.continuousClock) var clock
 
-    private enum CancelID { case timer }
+    private enum CancelID { case timer, dataObserver, dataChangeDebounce }
 
     var body: some ReducerOf<Self> {
         Reduce { state, action in
@@ -103,17 +137,20 @@ struct MenubarFeature {
             case .task:
                 // Initial setup
                 state.todayDate = todayString()
-                state.launchAtLogin = launchAgent.isMenubarServiceLoaded()
-
-                // Show onboarding if permissions aren't granted
-                if !permissions.allPermissionsGranted() {
-                    state.onboarding = OnboardingFeature.State()
-                }
 
                 return .merge(
                     .send(.refreshData),
                     startRefreshTimer(),
+                    startDataObserver(),
+                    // launchctl and `zeit doctor` run as subprocesses, so check
+                    // them in effects instead of blocking launch
+                    .run { send in
+                        await send(.launchAtLoginLoaded(launchAgent.isMenubarServiceLoaded()))
+                    },
+                    // Permissions first, so a missing permission takes priority
+                    // over the model download step in onboarding
                     .run { send in
+                        await send(.permissionsChecked(allGranted: permissions.allPermissionsGranted()))
                         let allDownloaded = await modelClient.allModelsDownloaded()
                         await send(.modelsCheckCompleted(allDownloaded: allDownloaded))
                     },
@@ -123,6 +160,17 @@ struct MenubarFeature {
                     }
                 )
 
+            case .launchAtLoginLoaded(let enabled):
+                state.launchAtLogin = enabled
+                return .none
+
+            case .permissionsChecked(let allGranted):
+                // Show onboarding if permissions aren't granted
+                if !allGranted && state.onboarding == nil {
+                    state.onboarding = OnboardingFeature.State()
+                }
+                return .none
+
             case .modelsCheckCompleted(let allDownloaded):
                 // If models aren't downloaded and onboarding isn't already showing,
                 // show onboarding starting at the model download step
@@ -134,31 +182,123 @@ struct MenubarFeature {
                 return .none
 
             case .refreshTick:
-                // Update tracking state and refresh data periodically
-                state.trackingState = tracking.getTrackingState()
+                // Tracking state parses the config and lastModified stats the
+                // database file, so build the signature in the effect rather
+                // than blocking the main thread
+                return .run { send in
+                    let signature = RefreshSignature(
+                        date: todayString(),
+                        databaseModifiedAt: database.lastModified(),
+                        trackingState: tracking.getTrackingState()
+                    )
+                    await send(.refreshChecked(signature))
+                }
+
+            case .dataDirectoryChanged:
+                // A single capture writes the database and its journal several
+                // times; wait for the burst to settle before checking
+                return .run { send in
+                    try await clock.sleep(for: .milliseconds(500))
+                    await send(.refreshTick)
+                }
+                .cancellable(id: CancelID.dataChangeDebounce, cancelInFlight: true)
+
+            case .refreshChecked(let signature):
+                // Update tracking state, and reload data only if the day, the
+                // database file, or the tracking state changed since last tick
+                if state.trackingState != signature.trackingState {
+                    state.trackingState = signature.trackingState
+                }
+                guard signature != state.refreshSignature else { return .none }
+                state.refreshSignature = signature
                 return .send(.refreshData)
 
             case .refreshData:
+                // Don't overlap loads; run one more once the current one lands
+                // so a refresh requested mid-load still sees the latest data
+                guard !state.isLoading else {
+                    state.isRefreshPending = true
+                    return .none
+                }
                 let today = todayString()
                 state.todayDate = today
                 state.isLoading = true
 
-                return .run { send in
-                    let record = try? await database.getDayRecord(today)
-                    let objectives = try? await database.getDayObjectives(today)
-                    await send(.dataLoaded(record, objectives))
+                return .run { [statsKey = state.statsKey] send in
+                    let start = ContinuousClock.now
+                    defer {
+                        let elapsed = ContinuousClock.now - start
+                        if elapsed > slowRefreshThreshold {
+                            logger.warning("Slow menubar refresh: \(elapsed / .milliseconds(1), format: .fixed(precision: 1))ms")
+                        }
+                    }
+
+                    let trackingState = tracking.getTrackingState()
+
+                    // Check the row's length and last timestamp first, so an
+                    // unchanged day skips fetching and decoding the activity JSON
+                    if let statsKey, statsKey.date == today,
+                       let summary = try? await database.getDayRecordSummary(today),
+                       summary.count == statsKey.count,
+                       summary.lastTimestamp == statsKey.lastTimestamp {
+                        do {
+                            let objectives = try await database.getDayObjectives(today)
+                            await send(.dataUnchanged(objectives, trackingState))
+                        } catch {
+                            logger.error("Failed to load objectives: \(error.localizedDescription)")
+                            await send(.dataLoadFailed(trackingState))
+                        }
+                        return
+                    }
+
+                    do {
+                        let bundle = try await database.getDayBundle(today)
+                        await send(.dataLoaded(bundle.record, bundle.objectives, trackingState))
+                    } catch {
+                        logger.error("Failed to load today's data: \(error.localizedDescription)")
+                        await send(.dataLoadFailed(trackingState))
+                    }
                 }
 
-            case .dataLoaded(let record, let objectives):
-                state.isLoading = false
-                state.trackingState = tracking.getTrackingState()
-                state.dayObjectives = objectives
+            case .dataUnchanged(let objectives, let trackingState):
+                return finishLoading(&state, objectives: objectives, trackingState: trackingState) ?? .none
+
+            case .dataLoadFailed(let trackingState):
+                // A failed read isn't an empty day; keep the last stats and
+                // objectives, and clear the signature so the next tick retries
+                state.refreshSignature = nil
+                return finishLoading(&state, objectives: state.dayObjectives, trackingState: trackingState) ?? .none
+
+            case .dataLoaded(let record, let objectives, let trackingState):
+                if let effect = finishLoading(&state, objectives: objectives, trackingState: trackingState) {
+                    return effect
+                }
 
                 if let record {
-                    state.totalActivities = record.count
-                    state.todayStats = computeActivityBreakdown(from: record.activities)
-                    state.workPercentage = workPercentage(from: state.todayStats)
-                } else {
+                    // Activities are append-only, so an unchanged count and last
+                    // timestamp mean the previous breakdown is still valid. The
+                    // timestamp catches a day cleared and refilled to the same count
+                    let key = StatsKey(
+                        date: record.date,
+                        count: record.count,
+                        lastTimestamp: record.activities.last?.timestamp
+                    )
+                    guard key != state.statsKey else { return .none }
+                    state.statsKey = key
+
+                    let stats = computeActivityBreakdown(from: record.activities)
+                    let work = workPercentage(from: stats)
+                    if state.totalActivities != record.count {
+                        state.totalActivities = record.count
+                    }
+                    if state.todayStats != stats {
+                        state.todayStats = stats
+                    }
+                    if state.workPercentage != work {
+                        state.workPercentage = work
+                    }
+                } else if state.statsKey != nil || state.totalActivities != 0 {
+                    state.statsKey = nil
                     state.totalActivities = 0
                     state.todayStats = []
                     state.workPercentage = 0
@@ -181,6 +321,9 @@ struct MenubarFeature {
                     }
                 }
 
+                // Ignore repeat clicks while a toggle is still being applied
+                guard !state.isTogglingTracking else { return .none }
+                state.isTogglingTracking = true
                 let isActive = state.trackingState.isActive
 
                 return .run { send in
@@ -192,17 +335,19 @@ struct MenubarFeature {
                             try await tracking.startTracking()
                             await notification.show("Zeit", "Resumed", "Tracking has been resumed")
                         }
-                        await send(.trackingToggled(.success(())))
+                        await send(.trackingToggled(.success(tracking.getTrackingState())))
                     } catch {
                         await send(.trackingToggled(.failure(error)))
                     }
                 }
 
-            case .trackingToggled(.success):
-                state.trackingState = tracking.getTrackingState()
+            case .trackingToggled(.success(let newState)):
+                state.isTogglingTracking = false
+                state.trackingState = newState
                 return .none
 
             case .trackingToggled(.failure(let error)):
+                state.isTogglingTracking = false
                 return .run { _ in
                     await notification.show(
                         "Zeit Error",
@@ -229,7 +374,12 @@ struct MenubarFeature {
                 return .none
 
             case .showObjectives:
-                state.objectives = ObjectivesFeature.State(date: state.todayDate)
+                // Prefill the editor with today's objectives when the menubar
+                // already holds them; otherwise the editor loads its own
+                state.objectives = ObjectivesFeature.State(
+                    date: state.todayDate,
+                    prefilledWith: state.dayObjectives
+                )
                 return .none
 
             case .showSettings:
@@ -242,16 +392,7 @@ struct MenubarFeature {
 
                 return .run { send in
                     do {
-                        let config = ZeitConfig.load()
-                        let identifier = ActivityIdentifier(
-                            visionModel: config.models.vision,
-                            textModel: config.models.text.model,
-                            textProvider: config.models.text.provider
-                        )
-                        let result = try await identifier.identifyCurrentActivity()
-                        let entry = result.toActivityEntry()
-                        let db = try DatabaseHelper()
-                        try await db.insertActivity(entry)
+                        let result = try await identifyAndRecordActivity()
                         await send(.forceTrackCompleted(.success(
                             ForceTrackInfo(
                                 activityName: result.activity.displayName,
@@ -330,16 +471,7 @@ struct MenubarFeature {
 
                 return .run { send in
                     do {
-                        let config = ZeitConfig.load()
-                        let identifier = ActivityIdentifier(
-                            visionModel: config.models.vision,
-                            textModel: config.models.text.model,
-                            textProvider: config.models.text.provider
-                        )
-                        let result = try await identifier.identifyCurrentActivity(sample: true)
-                        let entry = result.toActivityEntry()
-                        let db = try DatabaseHelper()
-                        try await db.insertActivity(entry)
+                        let result = try await identifyAndRecordActivity(sample: true)
                         await send(.sampleCompleted(.success(
                             SampleInfo(
                                 activityName: result.activity.displayName,
@@ -368,16 +500,7 @@ struct MenubarFeature {
                         if seconds > 0 {
                             try await Task.sleep(nanoseconds: UInt64(seconds) * 1_000_000_000)
                         }
-                        let config = ZeitConfig.load()
-                        let identifier = ActivityIdentifier(
-                            visionModel: config.models.vision,
-                            textModel: config.models.text.model,
-                            textProvider: config.models.text.provider
-                        )
-                        let result = try await identifier.identifyCurrentActivity(sample: true)
-                        let entry = result.toActivityEntry()
-                        let db = try DatabaseHelper()
-                        try await db.insertActivity(entry)
+                        let result = try await identifyAndRecordActivity(sample: true)
                         await send(.sampleCompleted(.success(
                             SampleInfo(
                                 activityName: result.activity.displayName,
@@ -524,19 +647,69 @@ struct MenubarFeature {
 
     // MARK: - Helpers
 
+    /// Fallback for changes the data observer can't see, such as the day
+    /// rolling over or work hours starting/ending. Precision doesn't matter,
+    /// so a generous tolerance lets the system coalesce the wakeup.
     private func startRefreshTimer() -> Effect<Action> {
         .run { send in
-            for await _ in clock.timer(interval: .seconds(60)) {
+            for await _ in clock.timer(interval: .seconds(300), tolerance: .seconds(30)) {
                 await send(.refreshTick)
             }
         }
         .cancellable(id: CancelID.timer)
     }
 
+    /// Refresh as soon as the tracker writes the database or the stop flag changes.
+    private func startDataObserver() -> Effect<Action> {
+        .run { send in
+            for await _ in database.observeChanges() {
+                await send(.dataDirectoryChanged)
+            }
+        }
+        .cancellable(id: CancelID.dataObserver)
+    }
+
+    /// Ends a load, applying the cheap fields that are reloaded every time.
+    /// Returns an effect if a refresh was requested mid-load and should run
+    /// instead of applying this (possibly stale) result.
+    private func finishLoading(
+        _ state: inout State,
+        objectives: DayObjectives?,
+        trackingState: TrackingState
+    ) -> Effect<Action>? {
+        state.isLoading = false
+        if state.isRefreshPending {
+            state.isRefreshPending = false
+            return .send(.refreshData)
+        }
+
+        // Only write fields whose value changed, so a refresh that loads
+        // the same data doesn't invalidate the popover or status item
+        if state.trackingState != trackingState {
+            state.trackingState = trackingState
+        }
+        if state.dayObjectives != objectives {
+            state.dayObjectives = objectives
+        }
+        return nil
+    }
+
+    /// Captures the screen, identifies the current activity, and stores it.
+    private func identifyAndRecordActivity(sample: Bool = false) async throws -> IdentificationResult {
+        let config = ZeitConfig.load()
+        let identifier = ActivityIdentifier(
+            visionModel: config.models.vision,
+            textModel: config.models.text.model,
+            textProvider: config.models.text.provider
+        )
+        let activityTypes = try await database.getActivityTypes()
+        let result = try await identifier.identifyCurrentActivity(sample: sample, activityTypes: activityTypes)
+        try await database.insertActivity(result.toActivityEntry())
+        return result
+    }
+
     private func todayString() -> String {
-        let formatter = DateFormatter()
-        formatter.dateFormat = "yyyy-MM-dd"
-        return formatter.string(from: Date())
+        DateHelpers.todayString()
     }
 }
 
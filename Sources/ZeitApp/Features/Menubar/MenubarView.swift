@@ -133,25 +133,7 @@ struct MenubarView: View {
             // Activity breakdown
             VStack(spacing: 2) {
                 ForEach(store.todayStats) { stat in
-                    HStack(spacing: 8) {
-                        Circle()
-                            .fill(stat.isWork ? Color.green : Color.blue)
-                            .frame(width: 6, height: 6)
-                        Text(stat.activity.displayName)
-                            .font(.caption)
-                        Spacer()
-                        Text("\(String(format: "%.0f", stat.percentage))%")
-                            .font(.caption)
-                            .monospacedDigit()
-                            .foregroundStyle(.secondary)
-                        Text("\(stat.count)m")
-                            .font(.caption2)
-                            .monospacedDigit()
-                            .foregroundStyle(.tertiary)
-                            .frame(width: 28, alignment: .trailing)
-                    }
-                    .padding(.horizontal, 14)
-                    .padding(.vertical, 3)
+                    MenubarStatRow(stat: stat)
                 }
             }
 
@@ -342,6 +324,36 @@ struct MenubarView: View {
     }
 }
 
+// MARK: - Menubar Stat Row
+
+/// One activity in the popover breakdown. A separate Equatable view so
+/// SwiftUI skips rows whose stat didn't change when the popover re-renders.
+private struct MenubarStatRow: View, Equatable {
+    let stat: ActivityStat
+
+    var body: some View {
+        HStack(spacing: 8) {
+            Circle()
+                .fill(stat.isWork ? Color.green : Color.blue)
+                .frame(width: 6, height: 6)
+            Text(stat.activity.displayName)
+                .font(.caption)
+            Spacer()
+            Text("\(String(format: "%.0f", stat.percentage))%")
+                .font(.caption)
+                .monospacedDigit()
+                .foregroundStyle(.secondary)
+            Text("\(stat.count)m")
+                .font(.caption2)
+                .monospacedDigit()
+                .foregroundStyle(.tertiary)
+                .frame(width: 28, alignment: .trailing)
+        }
+        .padding(.horizontal, 14)
+        .padding(.vertical, 3)
+    }
+}
+
 // MARK: - Menubar Action Button
 
 /// A button with hover effect for the menubar popover.
@@ -1,5 +1,11 @@
 import ComposableArchitecture
 import Foundation
+import os
+
+private let logger = Logger(subsystem: "com.zeit", category: "ObjectivesFeature")
+
+/// Saves slower than this are logged, to find what stalls the editor
+private let slowSaveThreshold: Duration = .milliseconds(50)
 
 @Reducer
 struct ObjectivesFeature {
@@ -12,6 +18,19 @@ struct ObjectivesFeature {
         var isLoading: Bool = false
         var isSaving: Bool = false
         var savedSuccessfully: Bool = false
+        /// Objectives were supplied up front, so `.task` doesn't need to load them
+        var isPrefilled: Bool = false
+
+        mutating func apply(_ objectives: DayObjectives?) {
+            guard let objectives else { return }
+            mainObjective = objectives.mainObjective
+            if objectives.secondaryObjectives.count > 0 {
+                secondary1 = objectives.secondaryObjectives[0]
+            }
+            if objectives.secondaryObjectives.count > 1 {
+                secondary2 = objectives.secondaryObjectives[1]
+            }
+        }
     }
 
     enum Action: BindableAction {
@@ -37,6 +56,7 @@ struct ObjectivesFeature {
                 return .none
 
             case .task:
+                guard !state.isPrefilled else { return .none }
                 state.isLoading = true
                 let date = state.date
 
@@ -47,16 +67,7 @@ struct ObjectivesFeature {
 
             case .objectivesLoaded(let objectives):
                 state.isLoading = false
-
-                if let objectives {
-                    state.mainObjective = objectives.mainObjective
-                    if objectives.secondaryObjectives.count > 0 {
-                        state.secondary1 = objectives.secondaryObjectives[0]
-                    }
-                    if objectives.secondaryObjectives.count > 1 {
-                        state.secondary2 = objectives.secondaryObjectives[1]
-                    }
-                }
+                state.apply(objectives)
                 return .none
 
             case .save:
@@ -76,6 +87,14 @@ struct ObjectivesFeature {
                 let secondary = secondaryList  // Create immutable copy
 
                 return .run { send in
+                    let start = ContinuousClock.now
+                    defer {
+                        let elapsed = ContinuousClock.now - start
+                        if elapsed > slowSaveThreshold {
+                            logger.warning("Slow objectives save: \(elapsed / .milliseconds(1), format: .fixed(precision: 1))ms")
+                        }
+                    }
+
                     do {
                         try await database.saveDayObjectives(date, main, secondary)
                         await send(.saved)
@@ -103,3 +122,12 @@ struct ObjectivesFeature {
         }
     }
 }
+
+extension ObjectivesFeature.State {
+    /// Start from objectives the caller has already loaded for `date`.
+    /// Without any, `.task` still loads them from the database.
+    init(date: String, prefilledWith objectives: DayObjectives?) {
+        self.init(date: date, isPrefilled: objectives != nil)
+        apply(objectives)
+    }
+}
@@ -27,7 +27,7 @@ struct PermissionsFeature {
     @Dependency(\.permissionsClient) var permissions
     @Dependency(\.continuousClock) var clock
 
-    private enum CancelID { case appObserver, refreshTimer }
+    private enum CancelID { case appObserver, permissionObserver, refreshTimer, check }
 
     var body: some ReducerOf<Self> {
         Reduce { state, action in
@@ -36,22 +36,34 @@ struct PermissionsFeature {
                 return .merge(
                     .send(.checkPermissions),
                     startAppObserver(),
+                    startPermissionObserver(),
                     startRefreshTimer()
                 )
 
             case .checkPermissions:
+                // Activation, change notifications, and the fallback timer can
+                // fire together; wait briefly so a burst runs the check once
                 return .run { send in
-                    let screen = permissions.screenRecordingStatus() == .granted
-                    let accessibility = permissions.accessibilityStatus() == .granted
+                    try await clock.sleep(for: .milliseconds(150))
+                    let statuses = permissions.statuses()
+                    let screen = statuses.screenRecording == .granted
+                    let accessibility = statuses.accessibility == .granted
                     await send(.permissionsUpdated(
                         screenRecording: screen,
                         accessibility: accessibility
                     ))
                 }
+                .cancellable(id: CancelID.check, cancelInFlight: true)
 
             case let .permissionsUpdated(screen, accessibility):
-                state.screenRecordingGranted = screen
-                state.accessibilityGranted = accessibility
+                // Polls mostly return the same result; only write on change so
+                // the permission rows aren't invalidated every check
+                if state.screenRecordingGranted != screen {
+                    state.screenRecordingGranted = screen
+                }
+                if state.accessibilityGranted != accessibility {
+                    state.accessibilityGranted = accessibility
+                }
 
                 if state.allGranted {
                     return .send(.allPermissionsGranted)
@@ -76,6 +88,7 @@ struct PermissionsFeature {
                 // Parent handles navigation/dismissal
                 return .merge(
                     .cancel(id: CancelID.appObserver),
+                    .cancel(id: CancelID.permissionObserver),
                     .cancel(id: CancelID.refreshTimer)
                 )
 
@@ -83,6 +96,7 @@ struct PermissionsFeature {
                 // Parent will handle dismissing
                 return .merge(
                     .cancel(id: CancelID.appObserver),
+                    .cancel(id: CancelID.permissionObserver),
                     .cancel(id: CancelID.refreshTimer)
                 )
             }
@@ -102,9 +116,19 @@ struct PermissionsFeature {
         .cancellable(id: CancelID.appObserver)
     }
 
+    private func startPermissionObserver() -> Effect<Action> {
+        .run { send in
+            for await _ in permissions.observePermissionChanges() {
+                await send(.checkPermissions)
+            }
+        }
+        .cancellable(id: CancelID.permissionObserver)
+    }
+
+    /// Fallback for changes no notification covers (Screen Recording).
     private func startRefreshTimer() -> Effect<Action> {
         .run { send in
-            for await _ in clock.timer(interval: .seconds(5)) {
+            for await _ in clock.timer(interval: .seconds(10), tolerance: .seconds(1)) {
                 await send(.checkPermissions)
             }
         }
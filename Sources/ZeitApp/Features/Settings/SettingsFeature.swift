@@ -108,8 +108,9 @@ struct SettingsFeature {
             case .task:
                 return .merge(
                     .run { send in
-                        let screen = permissions.screenRecordingStatus() == .granted
-                        let accessibility = permissions.accessibilityStatus() == .granted
+                        let statuses = permissions.statuses()
+                        let screen = statuses.screenRecording == .granted
+                        let accessibility = statuses.accessibility == .granted
                         await send(.permissionsUpdated(
                             screenRecording: screen,
                             accessibility: accessibility
@@ -148,7 +148,7 @@ struct WorkHoursPickerView: View {
                 set: { onSetHour($0) }
             )) {
                 ForEach(0..<24) { h in
-                    Text(Self.formatHour(h)).tag(h)
+                    Text(Self.hourLabels[h]).tag(h)
                 }
             }
             .labelsHidden()
@@ -174,12 +174,15 @@ struct WorkHoursPickerView: View {
 
     static let minuteOptions: [Int] = stride(from: 0, to: 60, by: 5).map { $0 }
 
-    static func formatHour(_ hour: Int) -> String {
+    /// Picker labels for hours 0-23, formatted once rather than per render
+    static let hourLabels: [String] = {
         let formatter = DateFormatter()
         formatter.dateFormat = "h a"
-        var components = DateComponents()
-        components.hour = hour
-        let date = Calendar.current.date(from: components) ?? Date()
-        return formatter.string(from: date)
-    }
+        return (0..<24).map { hour in
+            var components = DateComponents()
+            components.hour = hour
+            let date = Calendar.current.date(from: components) ?? Date()
+            return formatter.string(from: date)
+        }
+    }()
 }
@@ -19,7 +19,13 @@ final class ActivityIdentifier: @unchecked Sendable {
     /// Capture screenshots and identify the current activity
     /// - Parameter keepScreenshots: If true, don't delete screenshots after processing
     /// - Parameter sample: If true, collect all artifacts and write a sample to disk
-    func identifyCurrentActivity(keepScreenshots: Bool = false, debug: Bool = false, sample: Bool = false) async throws -> IdentificationResult {
+    /// - Parameter activityTypes: Types to classify against; loaded from the database if nil
+    func identifyCurrentActivity(
+        keepScreenshots: Bool = false,
+        debug: Bool = false,
+        sample: Bool = false,
+        activityTypes providedTypes: [ActivityType]? = nil
+    ) async throws -> IdentificationResult {
         // 1. Capture screenshots from all monitors
         let screenshots = try ScreenCapture.captureAllMonitors()
         let shouldKeep = keepScreenshots || sample
@@ -76,9 +82,14 @@ final class ActivityIdentifier: @unchecked Sendable {
             secondaryContext: nil
         )
 
-        // 5. Fetch activity types from DB for dynamic classification
-        let db = try DatabaseHelper()
-        let activityTypes = try await db.getActivityTypes()
+        // 5. Fetch activity types from DB for dynamic classification, unless
+        // the caller already has them from its own connection
+        let activityTypes: [ActivityType]
+        if let providedTypes {
+            activityTypes = providedTypes
+        } else {
+            activityTypes = try await DatabaseHelper().getActivityTypes()
+        }
 
         // 6. Call text model to classify the activity with structured output
         let classificationPrompt = Prompts.activityClassification(
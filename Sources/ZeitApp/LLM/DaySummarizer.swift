@@ -1,10 +1,11 @@
+import CryptoKit
 import Foundation
 import os
 
 private let logger = Logger(subsystem: "com.zeit", category: "DaySummarizer")
 
 /// Result of summarizing a day's activities
-struct DaySummary: Sendable {
+struct DaySummary: Codable, Equatable, Sendable {
     let summary: String
     let objectivesAlignment: String?
     let percentagesBreakdown: String
@@ -31,29 +32,38 @@ struct DaySummarizer: Sendable {
         objectives: DayObjectives? = nil,
         activityTypes: [ActivityType] = ActivityType.defaultTypes
     ) async throws -> DaySummary? {
-        let nonIdle = activities.filter { $0.activity != .idle }
-
-        guard !nonIdle.isEmpty else {
+        // Only the first and last non-idle entries are needed here; condensation
+        // does its own filtering, so avoid materializing another filtered copy.
+        guard let first = activities.first(where: { $0.activity != .idle }),
+            let last = activities.last(where: { $0.activity != .idle })
+        else {
             return nil
         }
 
-        logger.info("Starting summarization with \(nonIdle.count) non-idle activities")
-
         // Build condensed summary with grouped activities
         let condensed = buildCondensedSummary(from: activities, activityTypes: activityTypes)
 
+        logger.info("Starting summarization with \(condensed.originalEntryCount) non-idle activities")
+
         logger.info(
             "Condensed \(condensed.originalEntryCount) activities into \(condensed.condensedEntryCount) groups"
         )
 
+        // Activities repeat across groups; format each prompt name once
+        let activityNames = Dictionary(
+            uniqueKeysWithValues: condensed.percentageBreakdown.map {
+                ($0.activity, $0.activity.displayName.lowercased())
+            }
+        )
+
         // Format condensed activities for prompt
         let activitiesText = condensed.groups
-            .map { formatGroup($0) }
+            .map { formatGroup($0, activityName: activityNames[$0.activity]) }
             .joined(separator: "\n")
 
         // Format percentage breakdown
         let percentageText = condensed.percentageBreakdown
-            .map { "- \($0.activity.displayName.lowercased()): \(String(format: "%.1f", $0.percentage))%" }
+            .map { "- \(activityNames[$0.activity] ?? ""): \(String(format: "%.1f", $0.percentage))%" }
             .joined(separator: "\n")
 
         // Build the prompt
@@ -83,8 +93,8 @@ struct DaySummarizer: Sendable {
         let parsed = try parseSummaryResponse(responseText)
 
         let isoFormatter = ISO8601DateFormatter()
-        let startTime = isoFormatter.date(from: nonIdle[0].timestamp) ?? Date()
-        let endTime = isoFormatter.date(from: nonIdle[nonIdle.count - 1].timestamp) ?? Date()
+        let startTime = isoFormatter.date(from: first.timestamp) ?? Date()
+        let endTime = isoFormatter.date(from: last.timestamp) ?? Date()
 
         logger.debug("Day summary generated")
         return DaySummary(
@@ -96,6 +106,48 @@ struct DaySummarizer: Sendable {
         )
     }
 
+    // MARK: - Cache Key
+
+    /// Bump when the prompts or `summarySchema` change, so summaries cached by
+    /// an older version are regenerated instead of served.
+    static let summaryCacheVersion = 1
+
+    /// Key identifying the inputs of a summary, used to reuse cached results.
+    ///
+    /// Hashes the cache version and every entry's timestamp, activity and
+    /// reasoning together with the objectives and model, so any new entry,
+    /// edit, or prompt change produces a different key.
+    static func cacheKey(
+        activities: [ActivityEntry],
+        objectives: DayObjectives?,
+        model: String
+    ) -> String {
+        // ASCII unit/record/group separators keep adjacent fields from running
+        // together, so e.g. moving text between reasoning and the next entry
+        // still changes the key
+        let fieldSeparator = "\u{1f}"
+        let recordSeparator = "\u{1e}"
+        let sectionSeparator = Data("\u{1d}".utf8)
+
+        var hasher = SHA256()
+        hasher.update(data: Data("v\(summaryCacheVersion)".utf8))
+        hasher.update(data: sectionSeparator)
+        for entry in activities {
+            let record = [entry.timestamp, entry.activity.rawValue, entry.reasoning ?? ""]
+                .joined(separator: fieldSeparator) + recordSeparator
+            hasher.update(data: Data(record.utf8))
+        }
+        hasher.update(data: sectionSeparator)
+        if let objectives {
+            let record = ([objectives.mainObjective] + objectives.secondaryObjectives)
+                .joined(separator: fieldSeparator)
+            hasher.update(data: Data(record.utf8))
+        }
+        hasher.update(data: sectionSeparator)
+        hasher.update(data: Data(model.utf8))
+        return hasher.finalize().prefix(16).map { String(format: "%02x", $0) }.joined()
+    }
+
     // MARK: - JSON Schema
 
     private static func summarySchema(hasObjectives: Bool) -> [String: Any] {
@@ -140,21 +192,26 @@ struct DaySummarizer: Sendable {
 
     // MARK: - Formatting
 
-    private func formatTimeRange(start: Date, end: Date) -> String {
+    private static let timeFormatter: DateFormatter = {
         let formatter = DateFormatter()
         formatter.dateFormat = "HH:mm"
+        return formatter
+    }()
+
+    private func formatTimeRange(start: Date, end: Date) -> String {
+        let formatter = Self.timeFormatter
         if start == end {
             return formatter.string(from: start)
         }
         return "\(formatter.string(from: start))-\(formatter.string(from: end))"
     }
 
-    private func formatGroup(_ group: ActivityGroup) -> String {
+    private func formatGroup(_ group: ActivityGroup, activityName: String? = nil) -> String {
         let timeRange = formatTimeRange(start: group.startTime, end: group.endTime)
         let reasoning = group.reasonings.isEmpty
             ? "No description"
             : group.reasonings.joined(separator: "; ")
-        let activityName = group.activity.displayName.lowercased()
+        let activityName = activityName ?? group.activity.displayName.lowercased()
         return "\(timeRange) - \(activityName) (\(group.durationMinutes) min): \"\(reasoning)\""
     }
 }
@@ -1,4 +1,5 @@
 import Foundation
+import os
 
 /// Activity categories detected by the tracker.
 ///
@@ -51,10 +52,19 @@ struct Activity: Codable, Equatable, Sendable, Hashable {
 
     /// Human-readable display name (fallback: title-case the rawValue)
     var displayName: String {
-        rawValue
+        if let cached = Self.displayNames.withLock({ $0[rawValue] }) {
+            return cached
+        }
+        let name = rawValue
             .replacingOccurrences(of: "_", with: " ")
             .capitalized
+        Self.displayNames.withLock { $0[rawValue] = name }
+        return name
     }
+
+    /// Display names by rawValue. The set of activity types is small, so
+    /// entries are never evicted.
+    private static let displayNames = OSAllocatedUnfairLock(initialState: [String: String]())
 }
 
 /// A single activity entry at a specific timestamp
@@ -66,8 +76,10 @@ struct ActivityEntry: Codable, Equatable, Sendable {
 
     /// Parse the timestamp as a Date
     var date: Date? {
-        ISO8601DateFormatter().date(from: timestamp)
+        Self.timestampFormatter.date(from: timestamp)
     }
+
+    private static let timestampFormatter = ISO8601DateFormatter()
 }
 
 /// All activities for a single day
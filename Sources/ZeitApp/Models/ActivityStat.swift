@@ -25,22 +25,21 @@ func computeActivityBreakdown(
     activityTypes: [ActivityType] = ActivityType.defaultTypes,
     includeIdle: Bool = false
 ) -> [ActivityStat] {
-    let filtered = includeIdle
-        ? activities
-        : activities.filter { $0.activity != .idle }
+    // Count occurrences of each activity in one pass, without building a
+    // filtered copy of what can be a full day of entries
+    var counts: [Activity: Int] = [:]
+    var counted = 0
+    for entry in activities where includeIdle || entry.activity != .idle {
+        counts[entry.activity, default: 0] += 1
+        counted += 1
+    }
 
-    guard !filtered.isEmpty else { return [] }
+    guard counted > 0 else { return [] }
 
     // Build lookup for isWork
     let workIDs = Set(activityTypes.filter(\.isWork).map(\.id))
 
-    // Count occurrences of each activity
-    var counts: [Activity: Int] = [:]
-    for entry in filtered {
-        counts[entry.activity, default: 0] += 1
-    }
-
-    let total = Double(filtered.count)
+    let total = Double(counted)
 
     // Convert to stats and sort by percentage descending
     return counts
@@ -55,9 +54,29 @@ func computeActivityBreakdown(
         .sorted { $0.percentage > $1.percentage }
 }
 
+/// Work, personal, and idle shares of an activity breakdown
+struct CategoryPercentages: Equatable, Sendable {
+    var work: Double = 0
+    var personal: Double = 0
+    var idle: Double = 0
+}
+
+/// Sum activity stats into per-category percentages in a single pass
+func categoryPercentages(from stats: [ActivityStat]) -> CategoryPercentages {
+    var result = CategoryPercentages()
+    for stat in stats {
+        if stat.activity == .idle {
+            result.idle += stat.percentage
+        } else if stat.isWork {
+            result.work += stat.percentage
+        } else {
+            result.personal += stat.percentage
+        }
+    }
+    return result
+}
+
 /// Calculate work percentage from activity stats
 func workPercentage(from stats: [ActivityStat]) -> Double {
-    stats
-        .filter { $0.category == "work" }
-        .reduce(0.0) { $0 + $1.percentage }
+    categoryPercentages(from: stats).work
 }
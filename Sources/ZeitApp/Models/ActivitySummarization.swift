@@ -84,7 +84,9 @@ private let isoFormatter: ISO8601DateFormatter = {
 private func createGroup(from entries: [ActivityEntry]) -> ActivityGroup {
     let startTime = isoFormatter.date(from: entries[0].timestamp) ?? Date()
     let endTime = isoFormatter.date(from: entries[entries.count - 1].timestamp) ?? Date()
-    let reasonings = entries.compactMap(\.reasoning)
+    // Consecutive minutes often repeat the same reasoning; keep first occurrences only
+    var seen = Set<String>()
+    let reasonings = entries.compactMap(\.reasoning).filter { seen.insert($0).inserted }
 
     return ActivityGroup(
         activity: entries[0].activity,
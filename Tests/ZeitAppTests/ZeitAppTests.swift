@@ -17,9 +17,12 @@ struct MenubarFeatureTests {
             $0.notificationClient.show = { _, _, _ in }
         }
 
-        await store.send(.toggleTracking)
+        await store.send(.toggleTracking) {
+            $0.isTogglingTracking = true
+        }
 
-        await store.receive(.trackingToggled(.success(()))) {
+        await store.receive(.trackingToggled(.success(.pausedManual))) {
+            $0.isTogglingTracking = false
             $0.trackingState = .pausedManual
         }
     }
@@ -39,8 +42,147 @@ struct MenubarFeatureTests {
         await store.send(.toggleTracking)
         // No state change - just shows notification
     }
+
+    @Test
+    func refreshChecked_unchangedSignature_skipsReload() async {
+        let signature = RefreshSignature(date: "2025-01-01", databaseModifiedAt: nil, trackingState: .active)
+        let store = await TestStore(
+            initialState: MenubarFeature.State(trackingState: .active, refreshSignature: signature)
+        ) {
+            MenubarFeature()
+        }
+
+        await store.send(.refreshChecked(signature))
+        // No refreshData - nothing the load depends on has changed
+    }
+
+    @Test
+    func refreshData_whileLoading_reRunsOnceWithoutApplyingStaleResult() async {
+        let today = DateHelpers.todayString()
+        let record = DayRecord(date: today, activities: [
+            ActivityEntry(timestamp: "\(today)T10:00:00Z", activity: .workCoding, reasoning: nil, description: nil),
+        ])
+        let stats = computeActivityBreakdown(from: record.activities)
+
+        let store = await TestStore(
+            initialState: MenubarFeature.State(isLoading: true)
+        ) {
+            MenubarFeature()
+        } withDependencies: {
+            $0.trackingClient.getTrackingState = { .active }
+            $0.databaseClient.getDayBundle = { _ in (record: record, objectives: nil) }
+        }
+
+        await store.send(.refreshData) {
+            $0.isRefreshPending = true
+        }
+
+        // The in-flight load lands; it's discarded in favor of a fresh one
+        await store.send(.dataLoaded(nil, nil, .pausedManual)) {
+            $0.isLoading = false
+            $0.isRefreshPending = false
+        }
+
+        await store.receive(\.refreshData) {
+            $0.todayDate = today
+            $0.isLoading = true
+        }
+
+        await store.receive(\.dataLoaded) {
+            $0.isLoading = false
+            $0.trackingState = .active
+            $0.statsKey = StatsKey(date: today, count: 1, lastTimestamp: "\(today)T10:00:00Z")
+            $0.totalActivities = 1
+            $0.todayStats = stats
+            $0.workPercentage = workPercentage(from: stats)
+        }
+    }
+
+    @Test
+    func refreshData_summaryMatchesStatsKey_keepsStats() async {
+        let today = DateHelpers.todayString()
+        let stats = [ActivityStat(activity: .workCoding, count: 2, percentage: 100.0, isWork: true)]
+        let objectives = DayObjectives(
+            date: today,
+            mainObjective: "Ship the release",
+            secondaryObjectives: [],
+            createdAt: "\(today)T09:00:00Z",
+            updatedAt: "\(today)T09:00:00Z"
+        )
+
+        let store = await TestStore(
+            initialState: MenubarFeature.State(
+                todayStats: stats,
+                totalActivities: 2,
+                workPercentage: 100,
+                statsKey: StatsKey(date: today, count: 2, lastTimestamp: "\(today)T10:01:00Z")
+            )
+        ) {
+            MenubarFeature()
+        } withDependencies: {
+            $0.trackingClient.getTrackingState = { .active }
+            $0.databaseClient.getDayRecordSummary = { _ in (count: 2, lastTimestamp: "\(today)T10:01:00Z") }
+            $0.databaseClient.getDayObjectives = { _ in objectives }
+        }
+
+        await store.send(.refreshData) {
+            $0.todayDate = today
+            $0.isLoading = true
+        }
+
+        // Stats are left as they were; only the cheap fields are refreshed
+        await store.receive(\.dataUnchanged) {
+            $0.isLoading = false
+            $0.trackingState = .active
+            $0.dayObjectives = objectives
+        }
+    }
+
+    @Test
+    func refreshData_whenReadFails_keepsPreviousData() async {
+        let today = DateHelpers.todayString()
+        let stats = [ActivityStat(activity: .workCoding, count: 2, percentage: 100.0, isWork: true)]
+        let objectives = DayObjectives(
+            date: today,
+            mainObjective: "Ship the release",
+            secondaryObjectives: [],
+            createdAt: "\(today)T09:00:00Z",
+            updatedAt: "\(today)T09:00:00Z"
+        )
+        let signature = RefreshSignature(date: today, databaseModifiedAt: nil, trackingState: .active)
+
+        let store = await TestStore(
+            initialState: MenubarFeature.State(
+                trackingState: .active,
+                todayStats: stats,
+                totalActivities: 2,
+                workPercentage: 100,
+                refreshSignature: signature,
+                dayObjectives: objectives
+            )
+        ) {
+            MenubarFeature()
+        } withDependencies: {
+            $0.trackingClient.getTrackingState = { .active }
+            $0.databaseClient.getDayBundle = { _ in throw DatabaseReadError() }
+        }
+
+        await store.send(.refreshData) {
+            $0.todayDate = today
+            $0.isLoading = true
+        }
+
+        // Stats and objectives survive; the signature is cleared so the next
+        // tick retries
+        await store.receive(\.dataLoadFailed) {
+            $0.isLoading = false
+            $0.refreshSignature = nil
+        }
+    }
 }
 
+private struct DatabaseReadError: Error {}
+
 @Suite
 struct ActivityStatTests {
     @Test
@@ -72,4 +214,78 @@ struct ActivityStatTests {
 
         #expect(result == 70.0)  // workCoding + slack
     }
+
+    @Test
+    func categoryPercentages_splitsWorkPersonalAndIdle() {
+        let stats = [
+            ActivityStat(activity: .workCoding, count: 4, percentage: 40.0, isWork: true),
+            ActivityStat(activity: .personalBrowsing, count: 3, percentage: 30.0, isWork: false),
+            ActivityStat(activity: .slack, count: 2, percentage: 20.0, isWork: true),
+            ActivityStat(activity: .idle, count: 1, percentage: 10.0, isWork: false),
+        ]
+
+        let result = categoryPercentages(from: stats)
+
+        #expect(result == CategoryPercentages(work: 60.0, personal: 30.0, idle: 10.0))
+    }
+}
+
+@Suite
+struct ActivitySummarizationTests {
+    @Test
+    func groupConsecutiveActivities_deduplicatesReasonings() {
+        let activities = [
+            ActivityEntry(timestamp: "2025-01-01T10:00:00Z", activity: .workCoding, reasoning: "Editing Swift", description: nil),
+            ActivityEntry(timestamp: "2025-01-01T10:01:00Z", activity: .workCoding, reasoning: "Editing Swift", description: nil),
+            ActivityEntry(timestamp: "2025-01-01T10:02:00Z", activity: .workCoding, reasoning: "Running tests", description: nil),
+            ActivityEntry(timestamp: "2025-01-01T10:03:00Z", activity: .workCoding, reasoning: "Editing Swift", description: nil),
+        ]
+
+        let groups = groupConsecutiveActivities(from: activities)
+
+        #expect(groups.count == 1)
+        #expect(groups[0].durationMinutes == 4)
+        #expect(groups[0].reasonings == ["Editing Swift", "Running tests"])
+    }
+}
+
+@Suite
+struct DaySummarizerTests {
+    let activities = [
+        ActivityEntry(timestamp: "2025-01-01T10:00:00Z", activity: .workCoding, reasoning: "Editing Swift", description: nil),
+        ActivityEntry(timestamp: "2025-01-01T10:01:00Z", activity: .slack, reasoning: nil, description: nil),
+    ]
+
+    let objectives = DayObjectives(
+        date: "2025-01-01",
+        mainObjective: "Ship the release",
+        secondaryObjectives: ["Review PRs"],
+        createdAt: "2025-01-01T09:00:00Z",
+        updatedAt: "2025-01-01T09:00:00Z"
+    )
+
+    @Test
+    func cacheKey_isStableAndTracksEveryInput() {
+        let key = DaySummarizer.cacheKey(activities: activities, objectives: objectives, model: "qwen3:8b")
+
+        #expect(key == DaySummarizer.cacheKey(activities: activities, objectives: objectives, model: "qwen3:8b"))
+
+        var editedActivities = activities
+        editedActivities[1] = ActivityEntry(
+            timestamp: "2025-01-01T10:01:00Z", activity: .slack, reasoning: "Standup", description: nil
+        )
+        #expect(key != DaySummarizer.cacheKey(activities: editedActivities, objectives: objectives, model: "qwen3:8b"))
+
+        let editedObjectives = DayObjectives(
+            date: "2025-01-01",
+            mainObjective: "Ship the release",
+            secondaryObjectives: ["Review PRs", "Write docs"],
+            createdAt: "2025-01-01T09:00:00Z",
+            updatedAt: "2025-01-01T09:30:00Z"
+        )
+        #expect(key != DaySummarizer.cacheKey(activities: activities, objectives: editedObjectives, model: "qwen3:8b"))
+        #expect(key != DaySummarizer.cacheKey(activities: activities, objectives: nil, model: "qwen3:8b"))
+
+        #expect(key != DaySummarizer.cacheKey(activities: activities, objectives: objectives, model: "gpt-4o-mini"))
+    }
 }